@@ -1,14 +1,46 @@
+import importlib.util
 import json
 import logging
+import os
+import random
 import time
 from pathlib import Path
-from datetime import datetime
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from datetime import datetime, timezone
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import httpx
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        # OPT_NON_STR_KEYS keeps parity with stdlib json for int/enum dict keys.
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
 
-import requests
 
 logger = logging.getLogger(__name__)
 
+# Directories can only be opened for fsync on POSIX; elsewhere `sync_offline` is a no-op.
+_O_DIRECTORY: Optional[int] = getattr(os, "O_DIRECTORY", None)
+
+# RPC paths exposed by the wrapper methods below; their full URLs are precomputed per client.
+_KNOWN_PATHS = (
+    "byterover-check-handbook-existence",
+    "byterover-save-implementation-plan",
+    "byterover-update-plan-progress",
+    "byterover-store-knowledge",
+    "byterover-retrieve-knowledge",
+    "byterover-create-project",
+    "byterover-create-task",
+    "byterover-retrieve-active-plans",
+)
+
 
 class ByteroverClient:
     """Thin client for Byterover MCP with an offline fallback.
@@ -17,14 +49,27 @@ class ByteroverClient:
         client = ByteroverClient(endpoint=None, offline_dir='byterover_offline')
         client.byterover_save_implementation_plan({ 'title': 'Plan' })
 
+        # or, to release pooled connections deterministically:
+        with ByteroverClient(endpoint='http://localhost:8051') as client:
+            client.byterover_retrieve_active_plans()
+
     Behavior notes:
     - If `endpoint` is None the client writes JSON records to `offline_dir`.
     - When `extension_id` is provided the header `X-Byterover-Extension` is sent on remote calls.
     - When `auth_token` is provided the header `Authorization: Bearer <token>` is sent on remote calls.
-    - The client implements a small manual retry/backoff loop (configurable via `max_retries` and
-      `backoff_factor`) so unit tests that mock `Session.post` still exercise retry semantics.
+    - Remote calls go through a single `httpx.Client` (HTTP/2 when `h2` is installed). Its transport
+      retries failed connects; on top of that the client implements a small manual retry/backoff loop
+      (configurable via `max_retries` and `backoff_factor`) covering HTTP status and decode errors, so
+      unit tests that mock `Client.post` still exercise retry semantics. The jittered backoff schedule
+      is computed once at construction.
     """
 
+    # Offline filenames are built from ``time.time_ns()``; the second-resolution date prefixes are
+    # only re-rendered when the wall-clock second changes.
+    _LAST_SEC = -1
+    _DATE_PREFIX = ""
+    _ISO_PREFIX = ""
+
     def __init__(
         self,
         endpoint: Optional[str] = None,
@@ -40,54 +85,125 @@ class ByteroverClient:
         self.auth_token = auth_token
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
+        # Exponential backoff with up to one `backoff_factor` of jitter so concurrent clients retrying a
+        # degraded endpoint do not stay in lock-step. One entry per retry (the last attempt never sleeps).
+        self._backoff_schedule: Tuple[float, ...] = tuple(
+            backoff_factor * (2**i) + random.uniform(0, backoff_factor) for i in range(max(max_retries - 1, 0))
+        )
 
-        self.session = requests.sessions.Session()
-        try:
-            from urllib3.util.retry import Retry
-            from requests.adapters import HTTPAdapter
-
-            retry_strategy = Retry(total=max_retries, backoff_factor=backoff_factor, status_forcelist=[429, 500, 502, 503, 504])
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-            self.session.mount("http://", adapter)
-            self.session.mount("https://", adapter)
-        except (ImportError, AttributeError, ValueError):
-            pass
+        headers: Dict[str, str] = {}
+        if extension_id:
+            headers["X-Byterover-Extension"] = extension_id
+        if auth_token:
+            headers["Authorization"] = f"Bearer {auth_token}"
+        # Headers only depend on constructor arguments, so build them once; the read-only view guards
+        # against accidental mutation (httpx merges them into its own header collection per request).
+        self._base_headers: Mapping[str, str] = MappingProxyType(headers)
+
+        self._base_url = endpoint.rstrip("/") if endpoint else ""
+        self._url_for: Dict[str, str] = {p: f"{self._base_url}/{p}" for p in _KNOWN_PATHS} if endpoint else {}
+
+        # HTTP/2 lets every byterover RPC share one multiplexed connection; it needs the optional `h2`
+        # package (``httpx[http2]``), so fall back to pooled HTTP/1.1 keep-alive without it.
+        http2 = importlib.util.find_spec("h2") is not None
+        self.session = httpx.Client(
+            http2=http2,
+            timeout=10.0,
+            transport=httpx.HTTPTransport(http2=http2, retries=max_retries),
+        )
+
+        # The endpoint is fixed for the client's lifetime, so pick the transport once.
+        self._post = self._post_remote if endpoint else self._post_offline
 
         if not self.offline_dir.exists():
             self.offline_dir.mkdir(parents=True, exist_ok=True)
+        # Directory fd reused by `sync_offline`, opened on first use.
+        self._offline_dir_fd: Optional[int] = None
+        self._offline_dirty = False
+
+    def sync_offline(self) -> None:
+        """Make offline records written since the last sync durable with a single directory fsync.
+
+        Records are not fsynced one by one; callers that write a batch call this once at the end
+        (``close()`` does so automatically). No-op on platforms without ``O_DIRECTORY``.
+        """
+        if not self._offline_dirty or _O_DIRECTORY is None:
+            return
+        if self._offline_dir_fd is None:
+            try:
+                self._offline_dir_fd = os.open(str(self.offline_dir), os.O_RDONLY | _O_DIRECTORY)
+            except OSError as e:
+                logger.warning("Could not open offline dir %s for fsync: %s", self.offline_dir, e)
+                return
+        os.fsync(self._offline_dir_fd)
+        self._offline_dirty = False
+
+    def close(self) -> None:
+        """Sync pending offline records and release the pooled HTTP connections. Safe to call more than once."""
+        self.sync_offline()
+        if self._offline_dir_fd is not None:
+            os.close(self._offline_dir_fd)
+            self._offline_dir_fd = None
+        self.session.close()
+
+    def __enter__(self) -> "ByteroverClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "ByteroverClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @classmethod
+    def _timestamp(cls) -> Tuple[str, str]:
+        """Return ``(filename_stamp, iso_stamp)`` for the current UTC time."""
+        sec, ns = divmod(time.time_ns(), 1_000_000_000)
+        if sec != cls._LAST_SEC:
+            now = datetime.fromtimestamp(sec, tz=timezone.utc)
+            cls._DATE_PREFIX = now.strftime("%Y%m%dT%H%M%S")
+            cls._ISO_PREFIX = now.strftime("%Y-%m-%dT%H:%M:%S")
+            cls._LAST_SEC = sec
+        return f"{cls._DATE_PREFIX}{ns:09d}", f"{cls._ISO_PREFIX}.{ns // 1000:06d}"
 
     def _write_offline(self, action: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        ts = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+        ts, saved_at = self._timestamp()
         filename = self.offline_dir / f"{ts}_{action}.json"
-        record = {"action": action, "payload": payload, "saved_at": datetime.utcnow().isoformat()}
-        with open(filename, "w", encoding="utf-8") as fh:
-            json.dump(record, fh, indent=2)
+        record = {"action": action, "payload": payload, "saved_at": saved_at}
+        with open(filename, "wb") as fh:
+            fh.write(_dumps(record))
+        self._offline_dirty = True
         logger.info("Wrote offline byterover record: %s", filename)
         return {"success": True, "offline_file": str(filename)}
 
     def _post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        # Replaced per instance in __init__ by `_post_offline` or `_post_remote`.
         if not self.endpoint:
-            return self._write_offline(path, payload)
-        url = f"{self.endpoint.rstrip('/')}/{path.lstrip('/')}"
-        headers: Dict[str, str] = {}
-        if self.extension_id:
-            headers["X-Byterover-Extension"] = self.extension_id
-        if self.auth_token:
-            headers["Authorization"] = f"Bearer {self.auth_token}"
+            return self._post_offline(path, payload)
+        return self._post_remote(path, payload)
+
+    def _post_offline(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return self._write_offline(path, payload)
+
+    def _post_remote(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        url = self._url_for.get(path) or f"{self._base_url}/{path.lstrip('/')}"
 
         last_exc: Optional[Exception] = None
         for attempt in range(self.max_retries):
             try:
-                r = self.session.post(url, json=payload, timeout=10, headers=headers)
+                r = self.session.post(url, json=payload, headers=self._base_headers)
                 r.raise_for_status()
                 return r.json()
-            except (requests.RequestException, ValueError, KeyError) as e:
+            except (httpx.HTTPError, ValueError, KeyError) as e:
                 last_exc = e
                 logger.warning("Byterover call failed (attempt %d/%d) for %s: %s", attempt + 1, self.max_retries, path, e)
-                logger.debug("Byterover retry details: attempt=%d path=%s exception=%s", attempt + 1, path, repr(e))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Byterover retry details: attempt=%d path=%s exception=%r", attempt + 1, path, e)
                 if attempt < self.max_retries - 1:
-                    sleep_for = self.backoff_factor * (2 ** attempt)
-                    time.sleep(sleep_for)
+                    time.sleep(self._backoff_schedule[attempt])
                     continue
                 logger.warning("Byterover call exhausted retries, falling back to offline: %s", last_exc)
                 return self._write_offline(path, payload)
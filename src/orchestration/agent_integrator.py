@@ -4,10 +4,11 @@ Mobile-Agent-V3 Agent Integrator
 Bridges enhanced Phase 1.5 agents with the orchestration coordinator.
 Provides seamless integration between agent implementations and orchestration workflows.
 """
-from typing import Dict, List, Any, Optional, Type
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Protocol, Tuple, Type
 import asyncio
 import logging
-from abc import ABC, abstractmethod
+import time
 
 from src.orchestration.coordinator import OrchestrationCoordinator
 from src.agents.codegen_agent import CodeGenerationAgent
@@ -17,38 +18,88 @@ from database.models.agents import Agent, AgentStatus, AgentType
 from src.mcp_adapter.client import ByteroverClient
 
 
-class AgentAdapter(ABC):
-    """Abstract base class for agent adapters"""
+# Mock agent configuration keyed by agent name; read-only so it can be shared across integrators
+_AGENT_CONFIGS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "codegen-agent": MappingProxyType({
+        "type": AgentType.CODE_GENERATION,
+        "capabilities": ("python", "javascript", "typescript"),
+        "display_name": "Code Generation Agent"
+    }),
+    "testing-agent": MappingProxyType({
+        "type": AgentType.TESTING,
+        "capabilities": ("pytest", "jest", "coverage"),
+        "display_name": "Testing Agent"
+    }),
+    "documentation-agent": MappingProxyType({
+        "type": AgentType.DOCUMENTATION,
+        "capabilities": ("markdown", "readme"),
+        "display_name": "Documentation Agent"
+    })
+})
+_EMPTY_CONFIG: Mapping[str, Any] = MappingProxyType({})
+
+
+class AgentAdapter(Protocol):
+    """Interface implemented by agent adapters"""
+
+    CAPABILITIES: Tuple[str, ...]
 
-    def __init__(self, agent_instance: Any, agent_model: Agent):
-        self.agent = agent_instance
-        self.model = agent_model
-        self.logger = logging.getLogger(f"{self.__class__.__name__}")
-
-    @abstractmethod
     async def execute_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a task using the agent"""
-        pass
+        ...
 
-    @abstractmethod
-    async def get_capabilities(self) -> List[str]:
+    async def get_capabilities(self) -> Tuple[str, ...]:
         """Get agent capabilities"""
-        pass
+        ...
 
-    @abstractmethod
     async def is_available(self) -> bool:
         """Check if agent is available"""
-        pass
+        ...
 
-    @abstractmethod
     async def get_status(self) -> Dict[str, Any]:
         """Get agent status and metrics"""
-        pass
+        ...
+
+
+class _BaseAgentAdapter:
+    """Shared state for the concrete adapters (plain class, no ABCMeta dispatch)"""
+
+    # Subclasses declare their own (possibly empty) __slots__ so instances carry no __dict__
+    __slots__ = ("agent", "model")
+
+    # Static capability list; adapters that expose it let status scans skip awaiting get_capabilities()
+    CAPABILITIES: Tuple[str, ...] = ()
+
+    # Per-class logger, resolved once when each adapter subclass is defined
+    logger: logging.Logger = logging.getLogger(__qualname__)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(cls.__name__)
+
+    # Constant status metrics; get_status() copies them and fills in the live `status`
+    _STATUS_TEMPLATE: Mapping[str, Any] = MappingProxyType({})
+
+    def __init__(self, agent_instance: Any, agent_model: Agent):
+        self.agent = agent_instance
+        self.model = agent_model
+
+    async def get_status(self) -> Dict[str, Any]:
+        """Get agent status"""
+        return {"status": self.model.status.value, **self._STATUS_TEMPLATE}
 
 
-class CodeGenAgentAdapter(AgentAdapter):
+class CodeGenAgentAdapter(_BaseAgentAdapter):
     """Adapter for Code Generation Agent"""
 
+    __slots__ = ()
+    CAPABILITIES: Tuple[str, ...] = ("python", "javascript", "typescript", "java", "go")
+    _STATUS_TEMPLATE: Mapping[str, Any] = MappingProxyType({
+        "performance_score": 0.85,  # Would be calculated from history
+        "total_executions": 150,    # Would be tracked
+        "success_rate": 0.92        # Would be calculated
+    })
+
     async def execute_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute code generation task"""
         try:
@@ -64,30 +115,29 @@ class CodeGenAgentAdapter(AgentAdapter):
                 "artifacts": result.get("files", [])
             }
         except Exception as e:
-            self.logger.error(f"CodeGen execution failed: {str(e)}")
+            self.logger.error("CodeGen execution failed: %s", e)
             return {"success": False, "error": str(e)}
 
-    async def get_capabilities(self) -> List[str]:
+    async def get_capabilities(self) -> Tuple[str, ...]:
         """Get code generation capabilities"""
-        return ["python", "javascript", "typescript", "java", "go"]
+        return self.CAPABILITIES
 
     async def is_available(self) -> bool:
         """Check if agent is active"""
         return self.model.status == AgentStatus.ACTIVE
 
-    async def get_status(self) -> Dict[str, Any]:
-        """Get agent status"""
-        return {
-            "status": self.model.status.value,
-            "performance_score": 0.85,  # Would be calculated from history
-            "total_executions": 150,    # Would be tracked
-            "success_rate": 0.92       # Would be calculated
-        }
-
 
-class TestingAgentAdapter(AgentAdapter):
+class TestingAgentAdapter(_BaseAgentAdapter):
     """Adapter for Testing Agent"""
 
+    __slots__ = ()
+    CAPABILITIES: Tuple[str, ...] = ("pytest", "jest", "jasmine", "coverage", "quality")
+    _STATUS_TEMPLATE: Mapping[str, Any] = MappingProxyType({
+        "performance_score": 0.88,
+        "total_executions": 200,
+        "success_rate": 0.95
+    })
+
     async def execute_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute testing task"""
         try:
@@ -105,30 +155,29 @@ class TestingAgentAdapter(AgentAdapter):
                 "total": result.get("total", 0)
             }
         except Exception as e:
-            self.logger.error(f"Testing execution failed: {str(e)}")
+            self.logger.error("Testing execution failed: %s", e)
             return {"success": False, "error": str(e)}
 
-    async def get_capabilities(self) -> List[str]:
+    async def get_capabilities(self) -> Tuple[str, ...]:
         """Get testing capabilities"""
-        return ["pytest", "jest", "jasmine", "coverage", "quality"]
+        return self.CAPABILITIES
 
     async def is_available(self) -> bool:
         """Check if agent is active"""
         return self.model.status == AgentStatus.ACTIVE
 
-    async def get_status(self) -> Dict[str, Any]:
-        """Get agent status"""
-        return {
-            "status": self.model.status.value,
-            "performance_score": 0.88,
-            "total_executions": 200,
-            "success_rate": 0.95
-        }
-
 
-class DocumentationAgentAdapter(AgentAdapter):
+class DocumentationAgentAdapter(_BaseAgentAdapter):
     """Adapter for Documentation Agent"""
 
+    __slots__ = ()
+    CAPABILITIES: Tuple[str, ...] = ("readme", "api_docs", "markdown", "html", "pdf")
+    _STATUS_TEMPLATE: Mapping[str, Any] = MappingProxyType({
+        "performance_score": 0.82,
+        "total_executions": 120,
+        "success_rate": 0.89
+    })
+
     async def execute_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute documentation task"""
         try:
@@ -145,26 +194,17 @@ class DocumentationAgentAdapter(AgentAdapter):
                 "format": result.get("format", "markdown")
             }
         except Exception as e:
-            self.logger.error(f"Documentation execution failed: {str(e)}")
+            self.logger.error("Documentation execution failed: %s", e)
             return {"success": False, "error": str(e)}
 
-    async def get_capabilities(self) -> List[str]:
+    async def get_capabilities(self) -> Tuple[str, ...]:
         """Get documentation capabilities"""
-        return ["readme", "api_docs", "markdown", "html", "pdf"]
+        return self.CAPABILITIES
 
     async def is_available(self) -> bool:
         """Check if agent is active"""
         return self.model.status == AgentStatus.ACTIVE
 
-    async def get_status(self) -> Dict[str, Any]:
-        """Get agent status"""
-        return {
-            "status": self.model.status.value,
-            "performance_score": 0.82,
-            "total_executions": 120,
-            "success_rate": 0.89
-        }
-
 
 class AgentIntegrator:
     """
@@ -179,6 +219,11 @@ class AgentIntegrator:
         self.agent_adapters: Dict[str, AgentAdapter] = {}
         self.logger = logging.getLogger(__name__)
 
+        # Short-lived status report cache: (monotonic timestamp, report)
+        self.status_ttl = 0.25  # seconds
+        self._status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._status_lock = asyncio.Lock()
+
         # Agent type mapping
         self.adapter_classes = {
             AgentType.CODE_GENERATION: CodeGenAgentAdapter,
@@ -245,6 +290,7 @@ class AgentIntegrator:
             # Create adapter
             adapter = adapter_class(agent_instance, agent_model)
             self.agent_adapters[agent_name] = adapter
+            self._status_cache = None
 
             self.logger.info(f"Registered agent: {agent_name} with {agent_model.agent_type.value} capabilities")
             return True
@@ -257,60 +303,75 @@ class AgentIntegrator:
         """Create agent model instance (mock implementation)"""
         # This would typically query the database for agent configuration
         # For now, create mock models based on agent names
-
-        agent_configs = {
-            "codegen-agent": {
-                "type": AgentType.CODE_GENERATION,
-                "capabilities": ["python", "javascript", "typescript"],
-                "display_name": "Code Generation Agent"
-            },
-            "testing-agent": {
-                "type": AgentType.TESTING,
-                "capabilities": ["pytest", "jest", "coverage"],
-                "display_name": "Testing Agent"
-            },
-            "documentation-agent": {
-                "type": AgentType.DOCUMENTATION,
-                "capabilities": ["markdown", "readme"],
-                "display_name": "Documentation Agent"
-            }
-        }
-
-        config = agent_configs.get(agent_name, {})
+        config = _AGENT_CONFIGS.get(agent_name, _EMPTY_CONFIG)
         return Agent(
             name=agent_name,
             display_name=config.get("display_name", agent_name),
             agent_type=config["type"],
             status=AgentStatus.ACTIVE,
-            capabilities=config["capabilities"],
+            capabilities=list(config["capabilities"]),
             mcp_endpoints=["http://localhost:3001"]  # Mock endpoint
         )
 
+    async def _collect_agent_status(self, adapter: AgentAdapter) -> Tuple[Any, Any, Any]:
+        """Query availability, status and capabilities of one adapter concurrently"""
+        if adapter.CAPABILITIES:
+            available, agent_status = await asyncio.gather(
+                adapter.is_available(), adapter.get_status(), return_exceptions=True
+            )
+            return available, agent_status, adapter.CAPABILITIES
+        return tuple(await asyncio.gather(
+            adapter.is_available(), adapter.get_status(), adapter.get_capabilities(), return_exceptions=True
+        ))
+
     async def get_agent_status(self) -> Dict[str, Any]:
-        """Get status of all registered agents"""
+        """Get status of all registered agents.
+
+        Reports are cached for `status_ttl` seconds and concurrent callers share a single refresh, so
+        bursts of orchestrated tasks do not re-query every adapter.
+        """
+        cached = self._status_cache
+        if cached and time.monotonic() - cached[0] < self.status_ttl:
+            return cached[1]
+
+        async with self._status_lock:
+            # Another caller may have refreshed the report while we waited for the lock
+            cached = self._status_cache
+            if cached and time.monotonic() - cached[0] < self.status_ttl:
+                return cached[1]
+
+            status_report = await self._build_agent_status()
+            self._status_cache = (time.monotonic(), status_report)
+            return status_report
+
+    async def _build_agent_status(self) -> Dict[str, Any]:
+        """Assemble a fresh status report from all registered adapters"""
         status_report = {
             "total_agents": len(self.agent_adapters),
             "active_agents": 0,
             "agent_details": {}
         }
 
-        for name, adapter in self.agent_adapters.items():
-            try:
-                available = await adapter.is_available()
-                agent_status = await adapter.get_status()
-
-                status_report["agent_details"][name] = {
-                    "available": available,
-                    "status": agent_status,
-                    "capabilities": await adapter.get_capabilities()
-                }
+        names = list(self.agent_adapters)
+        collected = await asyncio.gather(
+            *(self._collect_agent_status(self.agent_adapters[name]) for name in names)
+        )
 
-                if available:
-                    status_report["active_agents"] += 1
+        for name, (available, agent_status, capabilities) in zip(names, collected):
+            error = next((r for r in (available, agent_status, capabilities) if isinstance(r, Exception)), None)
+            if error is not None:
+                self.logger.error(f"Failed to get status for agent {name}: {str(error)}")
+                status_report["agent_details"][name] = {"error": str(error)}
+                continue
+
+            status_report["agent_details"][name] = {
+                "available": available,
+                "status": agent_status,
+                "capabilities": capabilities
+            }
 
-            except Exception as e:
-                self.logger.error(f"Failed to get status for agent {name}: {str(e)}")
-                status_report["agent_details"][name] = {"error": str(e)}
+            if available:
+                status_report["active_agents"] += 1
 
         return status_report
 
@@ -4,11 +4,15 @@ Mobile-Agent-V3 Orchestration Coordinator
 Central orchestration system for multi-agent collaboration and task management.
 Coordinates agent interactions, manages task distribution, and optimizes workflow execution.
 """
-from typing import Dict, List, Any, Optional, Set, Tuple
+from typing import Deque, Dict, FrozenSet, List, Any, Optional, Set, Tuple
 import asyncio
 from datetime import datetime, timedelta
 import uuid
 import json
+import copy
+import hashlib
+import time
+from collections import OrderedDict, defaultdict, deque
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
@@ -19,6 +23,22 @@ from database.models.projects import Project
 from src.mcp_adapter.client import ByteroverClient
 
 
+# Skills required per sub-task type, as frozensets so agent scoring is a set intersection
+_SKILL_MAP: Dict[str, FrozenSet[str]] = {
+    "code_generation": frozenset(["code_generation", "python", "javascript"]),
+    "testing": frozenset(["testing", "pytest", "jest"]),
+    "documentation": frozenset(["documentation", "markdown"]),
+    "analysis": frozenset(["analysis", "code_review"])
+}
+_GENERIC_SKILLS: FrozenSet[str] = frozenset(["generic"])
+
+# Worker-pool queue levels, highest priority first
+QUEUE_INTERACTIVE = 0  # user-facing work that should jump the line
+QUEUE_SUBTASK = 1      # agent sub-tasks spawned by orchestration sessions
+QUEUE_BACKGROUND = 2   # maintenance such as optimization and health checks
+QUEUE_LEVELS = 3
+
+
 class OrchestrationStatus(Enum):
     """Status of orchestration operations"""
     PENDING = "pending"
@@ -44,6 +64,8 @@ class AgentExecution:
     status: TaskStatus = TaskStatus.PENDING
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
+    start_monotonic: Optional[float] = None  # time.monotonic() readings for duration math
+    end_monotonic: Optional[float] = None
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     performance_metrics: Dict[str, Any] = field(default_factory=dict)
@@ -51,6 +73,8 @@ class AgentExecution:
     @property
     def duration(self) -> Optional[timedelta]:
         """Calculate execution duration"""
+        if self.start_monotonic is not None and self.end_monotonic is not None:
+            return timedelta(seconds=self.end_monotonic - self.start_monotonic)
         if self.start_time and self.end_time:
             return self.end_time - self.start_time
         return None
@@ -64,7 +88,11 @@ class OrchestrationSession:
     status: OrchestrationStatus = OrchestrationStatus.PENDING
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
+    start_monotonic: Optional[float] = None  # time.monotonic() readings for duration math
+    end_monotonic: Optional[float] = None
     agent_executions: List[AgentExecution] = field(default_factory=list)
+    executions_by_task: Dict[str, AgentExecution] = field(default_factory=dict)  # task_id -> execution
+    status_buckets: Dict[TaskStatus, Set[str]] = field(default_factory=lambda: defaultdict(set))  # status -> task_ids
     collaboration_map: Dict[str, List[str]] = field(default_factory=dict)  # task -> [agent_ids]
     performance_metrics: Dict[str, Any] = field(default_factory=dict)
     context_snapshot: Dict[str, Any] = field(default_factory=dict)
@@ -72,21 +100,85 @@ class OrchestrationSession:
     @property
     def total_duration(self) -> Optional[timedelta]:
         """Calculate total session duration"""
+        if self.start_monotonic is not None and self.end_monotonic is not None:
+            return timedelta(seconds=self.end_monotonic - self.start_monotonic)
         if self.start_time and self.end_time:
             return self.end_time - self.start_time
         return None
 
+    def add_execution(self, execution: AgentExecution):
+        """Record an execution and index it by task ID"""
+        self.agent_executions.append(execution)
+        self.executions_by_task[execution.task_id] = execution
+        self.status_buckets[execution.status].add(execution.task_id)
+
+    def set_execution_status(self, execution: AgentExecution, status: TaskStatus):
+        """Transition an execution to a new status, keeping the status buckets in sync"""
+        self.status_buckets[execution.status].discard(execution.task_id)
+        execution.status = status
+        self.status_buckets[status].add(execution.task_id)
+
+    def count_executions(self, status: TaskStatus) -> int:
+        """Number of executions currently in the given status"""
+        return len(self.status_buckets[status])
+
+    def _executions_with_status(self, status: TaskStatus) -> List[AgentExecution]:
+        return [self.executions_by_task[task_id] for task_id in self.status_buckets[status]]
+
     def get_active_executions(self) -> List[AgentExecution]:
         """Get currently active executions"""
-        return [e for e in self.agent_executions if e.status == TaskStatus.IN_PROGRESS]
+        return self._executions_with_status(TaskStatus.IN_PROGRESS)
 
     def get_completed_executions(self) -> List[AgentExecution]:
         """Get completed executions"""
-        return [e for e in self.agent_executions if e.status == TaskStatus.COMPLETED]
+        return self._executions_with_status(TaskStatus.COMPLETED)
 
     def get_failed_executions(self) -> List[AgentExecution]:
         """Get failed executions"""
-        return [e for e in self.agent_executions if e.status == TaskStatus.FAILED]
+        return self._executions_with_status(TaskStatus.FAILED)
+
+
+class TokenBucket:
+    """Token-bucket rate limiter with AIMD adjustment of the refill rate.
+
+    `acquire()` waits until a token is available. `aimd_backoff()` halves the refill rate when the
+    endpoint signals rate limiting; `record_success()` recovers it linearly up to the configured rate.
+    """
+
+    def __init__(self, rate: float, burst: int, min_rate: float = 0.1):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self.tokens = float(burst)
+        self._last_refill = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def available(self) -> float:
+        """Tokens currently available"""
+        self._refill()
+        return self.tokens
+
+    async def acquire(self):
+        """Take one token, sleeping until the bucket has refilled enough"""
+        while True:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def aimd_backoff(self):
+        """Multiplicative decrease after a rate-limit signal"""
+        self.rate = max(self.min_rate, self.rate / 2)
+
+    def record_success(self):
+        """Additive increase back towards the configured rate"""
+        self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
 
 
 class OrchestrationCoordinator:
@@ -96,7 +188,10 @@ class OrchestrationCoordinator:
         self.byterover = byterover_client
         self.active_sessions: Dict[str, OrchestrationSession] = {}
         self.agent_pool: Dict[str, Agent] = {}
-        self.task_queue: asyncio.Queue = asyncio.Queue()
+        # Multi-level feedback queue for the worker pool: workers always serve the highest
+        # non-empty level; _boost_priorities periodically lifts waiting jobs to avoid starvation
+        self._task_queues: List[Deque[Tuple[Any, asyncio.Future]]] = [deque() for _ in range(QUEUE_LEVELS)]
+        self._queued_jobs = asyncio.Semaphore(0)
         self.logger = logging.getLogger(__name__)
 
         # Performance monitoring
@@ -107,6 +202,120 @@ class OrchestrationCoordinator:
         self.max_concurrent_agents = 10
         self.task_timeout_seconds = 300
         self.optimization_interval = 60  # seconds
+        self.session_retention_seconds = 24 * 3600
+        self.reaper_interval_seconds = 5
+
+        # Per-MCP-endpoint rate limiting (requests per second, burst size)
+        self.endpoint_rate_limit = 10.0
+        self.endpoint_burst = 20
+        self._buckets: Dict[str, TokenBucket] = {}
+
+        # Batched Byterover completion logging: flush up to log_batch_size records per
+        # log_flush_interval seconds
+        self.log_batch_size = 32
+        self.log_flush_interval = 0.2
+        self._log_queue: asyncio.Queue = asyncio.Queue()
+        self._log_flusher_task: Optional[asyncio.Task] = None
+        self._pending_log_batch: List[str] = []
+
+        # Decompositions of successfully orchestrated tasks, keyed by task fingerprint
+        self._plan_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.plan_cache_max = 128
+        self.plan_cache_ttl_seconds = 7 * 24 * 3600
+
+        # Worker pool draining the task queues; caps in-flight agent calls at max_concurrent_agents
+        self._workers: List[asyncio.Task] = []
+        self._background_tasks: List[asyncio.Task] = []
+
+        # Orchestration pipeline: bounded queues between the analyze, execute and postprocess
+        # stages so a slow downstream stage backpressures the ones feeding it
+        self.pipeline_stage_workers = {"analyze": 8, "execute": 16, "postprocess": 4}
+        self._q_analyze: asyncio.Queue = asyncio.Queue(maxsize=16)
+        self._q_execute: asyncio.Queue = asyncio.Queue(maxsize=32)
+        self._q_postprocess: asyncio.Queue = asyncio.Queue(maxsize=64)
+        self._stage_workers: List[asyncio.Task] = []
+
+    def _start_workers(self):
+        """Start the agent worker pool if it is not already running"""
+        if any(not w.done() for w in self._workers):
+            return
+        self._workers = [
+            asyncio.create_task(self._worker_loop()) for _ in range(self.max_concurrent_agents)
+        ]
+
+    async def _worker_loop(self):
+        """Pull (coroutine, future) jobs off the task queues and resolve their futures"""
+        while True:
+            await self._queued_jobs.acquire()
+            coro, future = next(q for q in self._task_queues if q).popleft()
+            if future.cancelled():
+                coro.close()
+                continue
+            try:
+                result = await coro
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                if not future.cancelled():
+                    future.set_result(result)
+
+    def _submit(self, coro, level: int = QUEUE_SUBTASK) -> asyncio.Future:
+        """Queue a coroutine for the worker pool at the given MLFQ level and return a future for its result"""
+        self._start_workers()
+        future = asyncio.get_running_loop().create_future()
+        self._task_queues[level].append((coro, future))
+        self._queued_jobs.release()
+        return future
+
+    def _boost_priorities(self) -> int:
+        """Move every waiting lower-level job to the top level so none starve"""
+        top = self._task_queues[QUEUE_INTERACTIVE]
+        boosted = 0
+        for queue in self._task_queues[QUEUE_INTERACTIVE + 1:]:
+            boosted += len(queue)
+            top.extend(queue)
+            queue.clear()
+        return boosted
+
+    async def shutdown(self):
+        """Cancel the pipeline stages, worker pool and background tasks, then flush pending logs"""
+        tasks = self._stage_workers + self._workers + self._background_tasks
+        if self._log_flusher_task is not None:
+            tasks.append(self._log_flusher_task)
+            self._log_flusher_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._stage_workers = []
+        self._workers = []
+        self._background_tasks = []
+
+        # Fail sessions still waiting between pipeline stages
+        for queue in (self._q_analyze, self._q_execute):
+            while not queue.empty():
+                ctx = queue.get_nowait()
+                self._resolve(ctx, self._fail_session(ctx["session"].session_id, RuntimeError("coordinator shut down")))
+                queue.task_done()
+        while not self._q_postprocess.empty():
+            self._q_postprocess.get_nowait()
+            self._q_postprocess.task_done()
+
+        # Drop jobs that never reached a worker
+        for queue in self._task_queues:
+            while queue:
+                coro, future = queue.popleft()
+                coro.close()
+                future.cancel()
+        self._queued_jobs = asyncio.Semaphore(0)
+
+        # Write out completion records the flusher had not sent yet
+        batch, self._pending_log_batch = self._pending_log_batch, []
+        while not self._log_queue.empty():
+            batch.append(self._log_queue.get_nowait())
+        await self._flush_session_logs(batch)
 
     async def initialize(self):
         """Initialize the orchestration coordinator"""
@@ -115,15 +324,24 @@ class OrchestrationCoordinator:
         # Load available agents
         await self._load_available_agents()
 
-        # Start background tasks
-        asyncio.create_task(self._performance_optimizer())
-        asyncio.create_task(self._health_monitor())
+        # Start background tasks and the agent worker pool
+        self._background_tasks = [
+            asyncio.create_task(self._performance_optimizer()),
+            asyncio.create_task(self._health_monitor()),
+            asyncio.create_task(self._zombie_reaper())
+        ]
+        self._start_workers()
 
         self.logger.info("Orchestration Coordinator initialized with "
                         f"{len(self.agent_pool)} available agents")
 
     async def orchestrate_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Main orchestration entry point for task processing"""
+        """Main orchestration entry point for task processing.
+
+        The session is handed to the staged pipeline (analyze -> execute -> postprocess); this
+        coroutine resolves once the execute stage has produced a result, while Byterover logging and
+        optimization run in the postprocess stage off the caller's critical path.
+        """
         session_id = str(uuid.uuid4())
         self.logger.info(f"Starting orchestration session {session_id}")
 
@@ -133,54 +351,123 @@ class OrchestrationCoordinator:
                 session_id=session_id,
                 root_task_id=task_data.get('id'),
                 start_time=datetime.now(),
+                start_monotonic=time.monotonic(),
                 context_snapshot=self._create_context_snapshot(task_data)
             )
 
             self.active_sessions[session_id] = session
 
-            # Analyze and decompose task
-            task_breakdown = await self._analyze_and_decompose_task(task_data)
+            self._start_pipeline()
+            future = asyncio.get_running_loop().create_future()
+            await self._q_analyze.put({"session": session, "task_data": task_data, "future": future})
+            return await future
 
-            # Create execution plan
-            execution_plan = await self._create_execution_plan(task_breakdown, session)
+        except Exception as e:
+            return self._fail_session(session_id, e)
 
-            # Execute orchestration
-            result = await self._execute_orchestration_plan(execution_plan, session)
+    def _fail_session(self, session_id: str, error: Exception) -> Dict[str, Any]:
+        """Mark a session as failed and build the failure result"""
+        self.logger.error(f"Orchestration failed for session {session_id}: {str(error)}")
 
-            # Complete session
-            session.status = OrchestrationStatus.COMPLETED
+        if session_id in self.active_sessions:
+            session = self.active_sessions[session_id]
+            session.status = OrchestrationStatus.FAILED
             session.end_time = datetime.now()
+            session.end_monotonic = time.monotonic()
 
-            # Log completion
-            await self._log_session_completion(session)
+        return {
+            "success": False,
+            "session_id": session_id,
+            "error": str(error)
+        }
 
-            # Optimize for future executions
-            await self._update_performance_optimization(session)
+    def _start_pipeline(self):
+        """Start the stage workers of the orchestration pipeline if they are not running"""
+        if any(not w.done() for w in self._stage_workers):
+            return
+        stages = (
+            (self._analyze_stage, self.pipeline_stage_workers["analyze"]),
+            (self._execute_stage, self.pipeline_stage_workers["execute"]),
+            (self._postprocess_stage, self.pipeline_stage_workers["postprocess"]),
+        )
+        self._stage_workers = [
+            asyncio.create_task(stage()) for stage, count in stages for _ in range(count)
+        ]
 
-            return {
-                "success": True,
-                "session_id": session_id,
-                "result": result,
-                "metrics": session.performance_metrics
-            }
+    async def _analyze_stage(self):
+        """Pipeline stage 1: analyze/decompose the task and build the execution plan"""
+        while True:
+            ctx = await self._q_analyze.get()
+            session = ctx["session"]
+            try:
+                # Analyze and decompose task
+                ctx["task_breakdown"] = await self._analyze_and_decompose_task(ctx["task_data"])
 
-        except Exception as e:
-            self.logger.error(f"Orchestration failed for session {session_id}: {str(e)}")
+                # Create execution plan
+                ctx["execution_plan"] = await self._create_execution_plan(ctx["task_breakdown"], session)
+            except Exception as e:
+                self._resolve(ctx, self._fail_session(session.session_id, e))
+            else:
+                await self._q_execute.put(ctx)
+            finally:
+                self._q_analyze.task_done()
+
+    async def _execute_stage(self):
+        """Pipeline stage 2: execute the plan and report the result to the caller"""
+        while True:
+            ctx = await self._q_execute.get()
+            session = ctx["session"]
+            try:
+                # Execute orchestration
+                result = await self._execute_orchestration_plan(ctx["execution_plan"], session)
 
-            # Mark session as failed
-            if session_id in self.active_sessions:
-                session = self.active_sessions[session_id]
-                session.status = OrchestrationStatus.FAILED
+                # Complete session
+                session.status = OrchestrationStatus.COMPLETED
                 session.end_time = datetime.now()
+                session.end_monotonic = time.monotonic()
+            except Exception as e:
+                self._resolve(ctx, self._fail_session(session.session_id, e))
+            else:
+                self._store_plan_template(ctx["task_breakdown"])
+                self._resolve(ctx, {
+                    "success": True,
+                    "session_id": session.session_id,
+                    "result": result,
+                    "metrics": session.performance_metrics
+                })
+                await self._q_postprocess.put(session)
+            finally:
+                self._q_execute.task_done()
+
+    async def _postprocess_stage(self):
+        """Pipeline stage 3: log completion and feed optimization with the finished session"""
+        while True:
+            session = await self._q_postprocess.get()
+            try:
+                # Log completion
+                await self._log_session_completion(session)
 
-            return {
-                "success": False,
-                "session_id": session_id,
-                "error": str(e)
-            }
+                # Optimize for future executions
+                await self._update_performance_optimization(session)
+            except Exception as e:
+                self.logger.error(f"Post-processing failed for session {session.session_id}: {str(e)}")
+            finally:
+                self._q_postprocess.task_done()
+
+    @staticmethod
+    def _resolve(ctx: Dict[str, Any], result: Dict[str, Any]):
+        """Hand a pipeline result back to the waiting orchestrate_task caller"""
+        if not ctx["future"].done():
+            ctx["future"].set_result(result)
 
     async def _analyze_and_decompose_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze task and break it down into sub-tasks for agent assignment"""
+        fingerprint = self._plan_fingerprint(task_data)
+        cached = self._instantiate_plan_template(fingerprint, task_data)
+        if cached is not None:
+            self.logger.info("Reusing cached task decomposition")
+            return cached
+
         self.logger.info("Analyzing and decomposing task")
 
         # Use CodeGeneration agent for task analysis
@@ -197,9 +484,56 @@ class OrchestrationCoordinator:
             "analysis": analysis_result,
             "collaboration_type": collaboration_type,
             "sub_tasks": sub_tasks,
-            "estimated_complexity": analysis_result.get("complexity_score", 1.0)
+            "estimated_complexity": analysis_result.get("complexity_score", 1.0),
+            "plan_fingerprint": fingerprint
         }
 
+    @staticmethod
+    def _plan_fingerprint(task_data: Dict[str, Any]) -> str:
+        """Hash the parts of a task that determine its decomposition"""
+        key = json.dumps(
+            {
+                "type": task_data.get("type"),
+                "desc": task_data.get("description", ""),
+                "req": task_data.get("requirements", []),
+                "hours": task_data.get("estimated_hours", 1)
+            },
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _store_plan_template(self, task_breakdown: Dict[str, Any]):
+        """Remember a successful decomposition for identical future tasks (LRU + age bound)"""
+        fingerprint = task_breakdown.get("plan_fingerprint")
+        if not fingerprint or fingerprint in self._plan_cache:
+            return
+        template = {k: v for k, v in task_breakdown.items() if k != "original_task"}
+        self._plan_cache[fingerprint] = (time.monotonic(), copy.deepcopy(template))
+        while len(self._plan_cache) > self.plan_cache_max:
+            self._plan_cache.popitem(last=False)
+
+    def _instantiate_plan_template(self, fingerprint: str, task_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Build a task breakdown from a cached template, minting fresh sub-task IDs"""
+        entry = self._plan_cache.get(fingerprint)
+        if entry is None:
+            return None
+        stored_at, template = entry
+        if time.monotonic() - stored_at > self.plan_cache_ttl_seconds:
+            del self._plan_cache[fingerprint]
+            return None
+        self._plan_cache.move_to_end(fingerprint)
+
+        breakdown = copy.deepcopy(template)
+        new_ids = {sub_task["id"]: str(uuid.uuid4()) for sub_task in breakdown["sub_tasks"]}
+        for sub_task in breakdown["sub_tasks"]:
+            sub_task["id"] = new_ids[sub_task["id"]]
+            sub_task["parent_id"] = task_data.get("id")
+            if sub_task.get("depends_on"):
+                sub_task["depends_on"] = [new_ids.get(d, d) for d in sub_task["depends_on"]]
+        breakdown["original_task"] = task_data
+        return breakdown
+
     async def _create_execution_plan(self, task_breakdown: Dict[str, Any], session: OrchestrationSession) -> Dict[str, Any]:
         """Create detailed execution plan with agent assignments"""
         self.logger.info(f"Creating execution plan for {len(task_breakdown['sub_tasks'])} sub-tasks")
@@ -225,7 +559,11 @@ class OrchestrationCoordinator:
                     agent_id=agents[0].id,  # Primary agent
                     task_id=sub_task["id"]
                 )
-                session.agent_executions.append(execution)
+                session.add_execution(execution)
+
+                # Explicit ordering constraints drive pipeline dispatch
+                if sub_task.get("depends_on"):
+                    execution_plan["dependencies"][sub_task["id"]] = set(sub_task["depends_on"])
 
                 # Update estimated duration
                 avg_duration = self._get_average_agent_duration(agents[0].id)
@@ -257,9 +595,9 @@ class OrchestrationCoordinator:
         for task_id, agent_ids in execution_plan["agent_assignments"].items():
             agent_id = agent_ids[0]  # Primary agent
 
-            execution = self._find_execution_by_task(task_id, session)
+            execution = session.executions_by_task.get(task_id)
             if execution:
-                result = await self._execute_agent_task(agent_id, task_id, execution)
+                result = await self._execute_agent_task(agent_id, task_id, execution, session)
                 results[task_id] = result
 
                 # Check if we should continue based on result
@@ -270,71 +608,136 @@ class OrchestrationCoordinator:
 
     async def _execute_parallel(self, execution_plan: Dict[str, Any], session: OrchestrationSession) -> Dict[str, Any]:
         """Execute tasks in parallel"""
+        task_ids = []
         tasks = []
 
         for task_id, agent_ids in execution_plan["agent_assignments"].items():
             agent_id = agent_ids[0]
-            execution = self._find_execution_by_task(task_id, session)
+            execution = session.executions_by_task.get(task_id)
             if execution:
-                task = self._execute_agent_task(agent_id, task_id, execution)
-                tasks.append((task_id, task))
+                task_ids.append(task_id)
+                tasks.append(self._submit(self._execute_agent_task(agent_id, task_id, execution, session)))
+
+        # Run through the bounded worker pool; one failing agent must not cancel the others
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
 
-        # Execute all parallel tasks
         results = {}
-        for task_id, task in tasks:
-            result = await task
-            results[task_id] = result
+        for task_id, outcome in zip(task_ids, outcomes):
+            if isinstance(outcome, BaseException):
+                outcome = {"success": False, "error": str(outcome)}
+            results[task_id] = outcome
 
         return results
 
     async def _execute_pipeline(self, execution_plan: Dict[str, Any], session: OrchestrationSession) -> Dict[str, Any]:
-        """Execute tasks in pipeline fashion (output of one feeds into next)"""
-        results = {}
-        previous_output = None
+        """Execute tasks in pipeline fashion (output of one feeds into next).
 
-        for task_id, agent_ids in execution_plan["agent_assignments"].items():
-            agent_id = agent_ids[0]
-            execution = self._find_execution_by_task(task_id, session)
-            if execution:
-                # Pass previous output as context
-                result = await self._execute_agent_task_with_context(
-                    agent_id, task_id, execution, previous_output
-                )
-                results[task_id] = result
-                previous_output = result
+        Tasks are dispatched as soon as all of their dependencies have completed, so independent
+        chains overlap. Without explicit `dependencies` the plan's assignment order forms a single chain.
+        """
+        assignments = execution_plan["agent_assignments"]
+        dependencies = execution_plan.get("dependencies") or self._linear_dependencies(list(assignments))
+
+        pending: Dict[str, Set[str]] = {
+            task_id: {d for d in dependencies.get(task_id, ()) if d in assignments and d != task_id}
+            for task_id in assignments
+        }
+        dependents: Dict[str, List[str]] = {}
+        for task_id, deps in pending.items():
+            for dep in deps:
+                dependents.setdefault(dep, []).append(task_id)
+
+        results: Dict[str, Any] = {}
+        running: Dict[asyncio.Future, str] = {}
+
+        def dispatch(task_id: str):
+            execution = session.executions_by_task.get(task_id)
+            if not execution:
+                # Nothing to run; treat as done so downstream tasks are not blocked
+                enqueue_downstream(task_id)
+                return
+            # Pass predecessor output as context (a mapping when there are several)
+            outputs = {d: results[d] for d in dependencies.get(task_id, ()) if d in results}
+            context = next(iter(outputs.values())) if len(outputs) == 1 else (outputs or None)
+            future = self._submit(self._execute_agent_task_with_context(
+                assignments[task_id][0], task_id, execution, context, session
+            ))
+            running[future] = task_id
+
+        def enqueue_downstream(task_id: str):
+            for dependent in dependents.get(task_id, ()):
+                waiting = pending[dependent]
+                waiting.discard(task_id)
+                if not waiting:
+                    dispatch(dependent)
+
+        for task_id, deps in pending.items():
+            if not deps:
+                dispatch(task_id)
+
+        while running:
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                task_id = running.pop(future)
+                try:
+                    results[task_id] = future.result()
+                except Exception as e:
+                    results[task_id] = {"success": False, "error": str(e)}
+                enqueue_downstream(task_id)
+
+        blocked = [task_id for task_id, deps in pending.items() if deps]
+        if blocked:
+            self.logger.warning(f"Pipeline tasks never became ready (cyclic dependencies?): {blocked}")
 
         return results
 
+    @staticmethod
+    def _linear_dependencies(task_ids: List[str]) -> Dict[str, Set[str]]:
+        """Chain tasks in order: each depends on the one before it"""
+        return {task_id: {prev} for prev, task_id in zip(task_ids, task_ids[1:])}
+
     async def _execute_hierarchical(self, execution_plan: Dict[str, Any], session: OrchestrationSession) -> Dict[str, Any]:
         """Execute tasks with hierarchical coordination"""
         # Simplified hierarchical execution
         return await self._execute_sequential(execution_plan, session)
 
-    async def _execute_agent_task(self, agent_id: str, task_id: str, execution: AgentExecution) -> Dict[str, Any]:
+    async def _execute_agent_task(self, agent_id: str, task_id: str, execution: AgentExecution,
+                                  session: OrchestrationSession) -> Dict[str, Any]:
         """Execute a single task on an agent"""
         self.logger.info(f"Executing task {task_id} on agent {agent_id}")
 
         try:
             execution.start_time = datetime.now()
-            execution.status = TaskStatus.IN_PROGRESS
+            execution.start_monotonic = time.monotonic()
+            session.set_execution_status(execution, TaskStatus.IN_PROGRESS)
 
             # Get agent instance
             agent = self.agent_pool.get(agent_id)
             if not agent:
                 raise ValueError(f"Agent {agent_id} not found")
 
-            # Execute task based on agent type
-            if agent.agent_type == AgentType.CODE_GENERATION:
-                result = await self._execute_codegen_task(agent, task_id)
-            elif agent.agent_type == AgentType.TESTING:
-                result = await self._execute_testing_task(agent, task_id)
-            elif agent.agent_type == AgentType.DOCUMENTATION:
-                result = await self._execute_documentation_task(agent, task_id)
-            else:
-                result = await self._execute_generic_task(agent, task_id)
+            # Respect the endpoint's rate limit before calling out
+            bucket = self._bucket_for(agent)
+            if bucket:
+                await bucket.acquire()
+
+            # Bound the agent call so a hung endpoint cannot pin a worker forever
+            try:
+                result = await asyncio.wait_for(
+                    self._dispatch_agent_task(agent, task_id), timeout=self.task_timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"timeout after {self.task_timeout_seconds}s") from None
+
+            if bucket:
+                if result.get("status_code") == 429:
+                    bucket.aimd_backoff()
+                else:
+                    bucket.record_success()
 
             execution.end_time = datetime.now()
-            execution.status = TaskStatus.COMPLETED
+            execution.end_monotonic = time.monotonic()
+            session.set_execution_status(execution, TaskStatus.COMPLETED)
             execution.result = result
 
             # Update performance metrics
@@ -344,18 +747,40 @@ class OrchestrationCoordinator:
 
         except Exception as e:
             execution.end_time = datetime.now()
-            execution.status = TaskStatus.FAILED
+            execution.end_monotonic = time.monotonic()
+            session.set_execution_status(execution, TaskStatus.FAILED)
             execution.error = str(e)
 
             self.logger.error(f"Task execution failed: {str(e)}")
             return {"success": False, "error": str(e)}
 
+    def _bucket_for(self, agent: Agent) -> Optional[TokenBucket]:
+        """Token bucket for the agent's primary MCP endpoint (None when it has no endpoint)"""
+        if not agent.mcp_endpoints:
+            return None
+        endpoint = agent.mcp_endpoints[0]
+        bucket = self._buckets.get(endpoint)
+        if bucket is None:
+            bucket = self._buckets[endpoint] = TokenBucket(self.endpoint_rate_limit, self.endpoint_burst)
+        return bucket
+
+    async def _dispatch_agent_task(self, agent: Agent, task_id: str) -> Dict[str, Any]:
+        """Execute task based on agent type"""
+        if agent.agent_type == AgentType.CODE_GENERATION:
+            return await self._execute_codegen_task(agent, task_id)
+        elif agent.agent_type == AgentType.TESTING:
+            return await self._execute_testing_task(agent, task_id)
+        elif agent.agent_type == AgentType.DOCUMENTATION:
+            return await self._execute_documentation_task(agent, task_id)
+        return await self._execute_generic_task(agent, task_id)
+
     async def _execute_agent_task_with_context(self, agent_id: str, task_id: str,
-                                              execution: AgentExecution, context: Any) -> Dict[str, Any]:
+                                              execution: AgentExecution, context: Any,
+                                              session: OrchestrationSession) -> Dict[str, Any]:
         """Execute agent task with additional context"""
         # Pass context to agent execution
         # This would be enhanced based on specific agent implementations
-        return await self._execute_agent_task(agent_id, task_id, execution)
+        return await self._execute_agent_task(agent_id, task_id, execution, session)
 
     async def _execute_codegen_task(self, agent, task_id: str) -> Dict[str, Any]:
         """Execute code generation task"""
@@ -476,21 +901,20 @@ class OrchestrationCoordinator:
             if agent.status == AgentStatus.ACTIVE and agent.is_available()
         ]
 
-        # Score agents based on capability matching and performance
-        agent_scores = []
-        for agent in available_agents:
-            score = self._calculate_agent_task_match_score(agent, required_skills)
-            agent_scores.append((agent, score))
-
-        # Sort by score and select top agent
-        agent_scores.sort(key=lambda x: x[1], reverse=True)
+        # Score agents based on capability matching and performance; only the top agent is needed,
+        # so keep a running max instead of sorting (ties go to the first agent, as before)
+        best_agent, best_score = max(
+            ((agent, self._calculate_agent_task_match_score(agent, required_skills)) for agent in available_agents),
+            key=lambda x: x[1],
+            default=(None, 0.0)
+        )
 
-        if agent_scores and agent_scores[0][1] > 0.5:  # Minimum threshold
-            return [agent_scores[0][0]]
+        if best_score > 0.5:  # Minimum threshold
+            return [best_agent]
 
         return []  # No suitable agents found
 
-    def _calculate_agent_task_match_score(self, agent: Agent, required_skills: List[str]) -> float:
+    def _calculate_agent_task_match_score(self, agent: Agent, required_skills: FrozenSet[str]) -> float:
         """Calculate how well an agent matches task requirements"""
         base_score = 0.0
 
@@ -499,7 +923,7 @@ class OrchestrationCoordinator:
             base_score += 0.4
 
         # Capability matching
-        capability_matches = sum(1 for skill in required_skills if skill in agent.capabilities)
+        capability_matches = len(required_skills & self._capability_set(agent))
         base_score += min(capability_matches * 0.2, 0.4)
 
         # Performance score
@@ -508,15 +932,17 @@ class OrchestrationCoordinator:
 
         return min(base_score, 1.0)
 
-    def _get_required_skills_for_task(self, task_type: str) -> List[str]:
+    @staticmethod
+    def _capability_set(agent: Agent) -> FrozenSet[str]:
+        """Agent capabilities as a frozenset, computed once per agent instance"""
+        caps = getattr(agent, "_cap_set", None)
+        if caps is None:
+            caps = agent._cap_set = frozenset(agent.capabilities or ())
+        return caps
+
+    def _get_required_skills_for_task(self, task_type: str) -> FrozenSet[str]:
         """Get required skills for a task type"""
-        skill_map = {
-            "code_generation": ["code_generation", "python", "javascript"],
-            "testing": ["testing", "pytest", "jest"],
-            "documentation": ["documentation", "markdown"],
-            "analysis": ["analysis", "code_review"]
-        }
-        return skill_map.get(task_type, ["generic"])
+        return _SKILL_MAP.get(task_type, _GENERIC_SKILLS)
 
     async def _load_available_agents(self):
         """Load available agents from database"""
@@ -549,6 +975,9 @@ class OrchestrationCoordinator:
             )
         }
 
+        for agent in self.agent_pool.values():
+            agent._cap_set = frozenset(agent.capabilities)
+
     def _create_context_snapshot(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a snapshot of the current context"""
         return {
@@ -559,13 +988,6 @@ class OrchestrationCoordinator:
             "active_sessions": len(self.active_sessions)
         }
 
-    def _find_execution_by_task(self, task_id: str, session: OrchestrationSession) -> Optional[AgentExecution]:
-        """Find execution by task ID"""
-        for execution in session.agent_executions:
-            if execution.task_id == task_id:
-                return execution
-        return None
-
     def _should_continue_after_result(self, result: Dict[str, Any]) -> bool:
         """Determine if orchestration should continue after a result"""
         return result.get("success", False)
@@ -594,7 +1016,8 @@ class OrchestrationCoordinator:
         while True:
             try:
                 await asyncio.sleep(self.optimization_interval)
-                await self._optimize_agent_assignments()
+                self._boost_priorities()
+                await self._submit(self._optimize_agent_assignments(), QUEUE_BACKGROUND)
                 await self._cleanup_completed_sessions()
             except Exception as e:
                 self.logger.error(f"Performance optimization error: {str(e)}")
@@ -606,12 +1029,12 @@ class OrchestrationCoordinator:
 
     async def _cleanup_completed_sessions(self):
         """Clean up old completed sessions"""
-        cutoff_time = datetime.now() - timedelta(hours=24)
+        cutoff = time.monotonic() - self.session_retention_seconds
         to_remove = []
 
         for session_id, session in self.active_sessions.items():
             if (session.status in [OrchestrationStatus.COMPLETED, OrchestrationStatus.FAILED]
-                and session.end_time and session.end_time < cutoff_time):
+                and session.end_monotonic is not None and session.end_monotonic < cutoff):
                 to_remove.append(session_id)
 
         for session_id in to_remove:
@@ -623,10 +1046,37 @@ class OrchestrationCoordinator:
         while True:
             try:
                 await asyncio.sleep(60)  # Check every minute
-                await self._check_agent_health()
+                await self._submit(self._check_agent_health(), QUEUE_BACKGROUND)
             except Exception as e:
                 self.logger.error(f"Health monitoring error: {str(e)}")
 
+    async def _zombie_reaper(self):
+        """Background task failing executions stuck IN_PROGRESS past the task timeout"""
+        while True:
+            try:
+                await asyncio.sleep(self.reaper_interval_seconds)
+                self._reap_stuck_executions()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Zombie reaper error: {str(e)}")
+
+    def _reap_stuck_executions(self) -> int:
+        """Mark executions running longer than task_timeout_seconds as failed"""
+        cutoff = time.monotonic() - self.task_timeout_seconds
+        reaped = 0
+        for session in self.active_sessions.values():
+            for execution in session.get_active_executions():
+                if execution.start_monotonic is not None and execution.start_monotonic < cutoff:
+                    execution.end_time = datetime.now()
+                    execution.end_monotonic = time.monotonic()
+                    execution.error = "timeout (reaped)"
+                    session.set_execution_status(execution, TaskStatus.FAILED)
+                    self.logger.warning(f"Reaped stuck execution of task {execution.task_id} "
+                                        f"in session {session.session_id}")
+                    reaped += 1
+        return reaped
+
     async def _check_agent_health(self):
         """Check the health of all agents"""
         for agent in self.agent_pool.values():
@@ -634,14 +1084,56 @@ class OrchestrationCoordinator:
             pass
 
     async def _log_session_completion(self, session: OrchestrationSession):
-        """Log session completion to Byterover"""
-        await self.byterover.byterover_store_knowledge(
+        """Queue a session completion record for the batched Byterover log flusher"""
+        total = len(session.agent_executions)
+        success_rate = session.count_executions(TaskStatus.COMPLETED) / total * 100 if total else 0.0
+        self._start_log_flusher()
+        await self._log_queue.put(
             f"Mobile-Agent-V3 orchestration session {session.session_id} completed. "
             f"Duration: {session.total_duration}. "
             f"Agents used: {len(session.agent_executions)}. "
-            f"Success rate: {len(session.get_completed_executions()) / len(session.agent_executions) * 100:.1f}%"
+            f"Success rate: {success_rate:.1f}%"
         )
 
+    def _start_log_flusher(self):
+        """Start the completion log flusher if it is not running"""
+        if self._log_flusher_task is None or self._log_flusher_task.done():
+            self._log_flusher_task = asyncio.create_task(self._log_flusher())
+
+    async def _log_flusher(self):
+        """Coalesce completion records into one Byterover write per batch window"""
+        loop = asyncio.get_running_loop()
+        while True:
+            self._pending_log_batch = [await self._log_queue.get()]
+            deadline = loop.time() + self.log_flush_interval
+            while len(self._pending_log_batch) < self.log_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    self._pending_log_batch.append(await asyncio.wait_for(self._log_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            batch, self._pending_log_batch = self._pending_log_batch, []
+            await self._flush_session_logs(batch)
+
+    async def _flush_session_logs(self, batch: List[str]):
+        """Store a batch of completion records with a single Byterover call"""
+        if not batch:
+            return
+        try:
+            await self._store_knowledge("\n\n".join(batch))
+        except Exception as e:
+            self.logger.error(f"Failed to log {len(batch)} session completions: {str(e)}")
+
+    async def _store_knowledge(self, messages: str):
+        """Call byterover_store_knowledge on either an async or a blocking client"""
+        store = self.byterover.byterover_store_knowledge
+        if asyncio.iscoroutinefunction(store):
+            return await store(messages)
+        # The stock ByteroverClient is synchronous; keep its I/O off the event loop
+        return await asyncio.to_thread(store, messages)
+
     async def _update_performance_optimization(self, session: OrchestrationSession):
         """Update optimization models with completed session data"""
         # This would feed data to ML optimization models
@@ -655,7 +1147,13 @@ class OrchestrationCoordinator:
             "total_sessions_completed": sum(1 for s in self.active_sessions.values()
                                          if s.status == OrchestrationStatus.COMPLETED),
             "average_session_duration": self._calculate_average_session_duration(),
-            "agent_performance_scores": self.agent_performance_scores.copy()
+            "agent_performance_scores": self.agent_performance_scores.copy(),
+            "task_queue_depths": [len(q) for q in self._task_queues],
+            "pipeline_queue_depths": {
+                "analyze": self._q_analyze.qsize(),
+                "execute": self._q_execute.qsize(),
+                "postprocess": self._q_postprocess.qsize()
+            }
         }
 
     def _calculate_average_session_duration(self) -> Optional[float]:
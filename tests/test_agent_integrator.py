@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from database.models.agents import Agent, AgentStatus, AgentType
+from src.mcp_adapter.client import ByteroverClient
+from src.orchestration import agent_integrator as integration
+from src.orchestration.coordinator import OrchestrationCoordinator
+
+
+def _make_integrator(tmp_path):
+    client = ByteroverClient(endpoint=None, offline_dir=str(tmp_path / "offline"))
+    integrator = integration.AgentIntegrator(OrchestrationCoordinator(client), client)
+    for name, adapter_cls, agent_type in (
+        ("codegen-agent", integration.CodeGenAgentAdapter, AgentType.CODE_GENERATION),
+        ("testing-agent", integration.TestingAgentAdapter, AgentType.TESTING),
+        ("documentation-agent", integration.DocumentationAgentAdapter, AgentType.DOCUMENTATION),
+    ):
+        model = Agent(name=name, display_name=name, agent_type=agent_type, status=AgentStatus.ACTIVE, capabilities=[])
+        integrator.agent_adapters[name] = adapter_cls(None, model)
+    return integrator
+
+
+def test_agent_status_reports_static_capabilities(tmp_path):
+    integrator = _make_integrator(tmp_path)
+    report = asyncio.run(integrator.get_agent_status())
+    assert report["total_agents"] == 3
+    assert report["active_agents"] == 3
+    details = report["agent_details"]["codegen-agent"]
+    assert details["available"] is True
+    assert details["capabilities"] == integration.CodeGenAgentAdapter.CAPABILITIES
+    assert details["status"]["status"] == "active"
+
+
+def test_agent_status_isolates_failing_adapter(tmp_path, monkeypatch):
+    integrator = _make_integrator(tmp_path)
+
+    async def broken_status(self):
+        raise RuntimeError("status backend down")
+
+    monkeypatch.setattr(integration.TestingAgentAdapter, "get_status", broken_status)
+    report = asyncio.run(integrator.get_agent_status())
+    assert report["agent_details"]["testing-agent"] == {"error": "status backend down"}
+    assert report["active_agents"] == 2
+
+
+def test_agent_status_is_cached_and_coalesced(tmp_path, monkeypatch):
+    integrator = _make_integrator(tmp_path)
+    calls = {"count": 0}
+    original = integration.AgentIntegrator._build_agent_status
+
+    async def counting_build(self):
+        calls["count"] += 1
+        return await original(self)
+
+    monkeypatch.setattr(integration.AgentIntegrator, "_build_agent_status", counting_build)
+
+    async def burst():
+        return await asyncio.gather(*(integrator.get_agent_status() for _ in range(5)))
+
+    reports = asyncio.run(burst())
+    assert calls["count"] == 1
+    assert all(r is reports[0] for r in reports)
+
+    integrator.status_ttl = 0
+    asyncio.run(integrator.get_agent_status())
+    assert calls["count"] == 2
+
+
+def test_create_agent_model_uses_static_config(tmp_path):
+    integrator = _make_integrator(tmp_path)
+    model = asyncio.run(integrator._create_agent_model("testing-agent"))
+    assert model.agent_type == AgentType.TESTING
+    assert model.display_name == "Testing Agent"
+    assert model.capabilities == ["pytest", "jest", "coverage"]
+    with pytest.raises(KeyError):
+        asyncio.run(integrator._create_agent_model("unknown-agent"))
+
+
+def test_adapters_have_no_instance_dict(tmp_path):
+    integrator = _make_integrator(tmp_path)
+    for adapter in integrator.agent_adapters.values():
+        assert not hasattr(adapter, "__dict__")
+
+
+def test_adapter_loggers_are_per_class(tmp_path):
+    integrator = _make_integrator(tmp_path)
+    adapter = integrator.agent_adapters["codegen-agent"]
+    assert adapter.logger is integration.CodeGenAgentAdapter.logger
+    assert adapter.logger.name == "CodeGenAgentAdapter"
+
+
+def test_adapter_status_copies_template(tmp_path):
+    integrator = _make_integrator(tmp_path)
+    adapter = integrator.agent_adapters["testing-agent"]
+    status = asyncio.run(adapter.get_status())
+    assert status == {"status": "active", "performance_score": 0.88, "total_executions": 200, "success_rate": 0.95}
+    status["success_rate"] = 0.0
+    assert asyncio.run(adapter.get_status())["success_rate"] == 0.95
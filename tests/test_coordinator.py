@@ -0,0 +1,423 @@
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from database.models.agents import Agent, AgentStatus, AgentType
+from database.models.tasks import TaskStatus
+from src.orchestration.coordinator import AgentExecution, OrchestrationCoordinator, OrchestrationSession
+
+
+class FakeByterover:
+    def __init__(self):
+        self.knowledge = []
+
+    async def byterover_store_knowledge(self, messages):
+        self.knowledge.append(messages)
+        return {"success": True}
+
+
+def _make_agent(name, agent_type, capabilities):
+    agent = Agent(
+        name=name,
+        display_name=name,
+        agent_type=agent_type,
+        status=AgentStatus.ACTIVE,
+        capabilities=capabilities,
+        mcp_endpoints=["http://localhost:3001"],
+    )
+    agent.id = name
+    agent.last_heartbeat = datetime.now()
+    return agent
+
+
+def _make_coordinator():
+    coordinator = OrchestrationCoordinator(FakeByterover())
+    coordinator.agent_pool = {
+        "codegen-agent": _make_agent("codegen-agent", AgentType.CODE_GENERATION, ["python", "javascript"]),
+        "testing-agent": _make_agent("testing-agent", AgentType.TESTING, ["pytest", "jest"]),
+        "documentation-agent": _make_agent("documentation-agent", AgentType.DOCUMENTATION, ["markdown"]),
+    }
+    return coordinator
+
+
+def _make_session(coordinator, task_agents):
+    session = OrchestrationSession(session_id="s-1", root_task_id="root")
+    plan = {"session_id": "s-1", "agent_assignments": {}}
+    for task_id, agent_id in task_agents.items():
+        plan["agent_assignments"][task_id] = [agent_id]
+        session.add_execution(AgentExecution(agent_id=agent_id, task_id=task_id))
+    return session, plan
+
+
+def test_execute_parallel_runs_agents_concurrently(monkeypatch):
+    coordinator = _make_coordinator()
+    session, plan = _make_session(coordinator, {"t1": "codegen-agent", "t2": "testing-agent", "t3": "codegen-agent"})
+    in_flight = {"now": 0, "peak": 0}
+
+    async def slow_codegen(self, agent, task_id, *args, **kwargs):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return {"success": True, "task_type": "code_generation"}
+
+    monkeypatch.setattr(OrchestrationCoordinator, "_execute_codegen_task", slow_codegen)
+    monkeypatch.setattr(OrchestrationCoordinator, "_execute_testing_task", slow_codegen)
+
+    results = asyncio.run(coordinator._execute_parallel(plan, session))
+    assert set(results) == {"t1", "t2", "t3"}
+    assert all(r["success"] for r in results.values())
+    assert in_flight["peak"] == 3
+    assert all(e.status == TaskStatus.COMPLETED for e in session.agent_executions)
+
+
+def test_execute_parallel_respects_worker_pool_size(monkeypatch):
+    coordinator = _make_coordinator()
+    coordinator.max_concurrent_agents = 2
+    session, plan = _make_session(coordinator, {f"t{i}": "codegen-agent" for i in range(6)})
+    in_flight = {"now": 0, "peak": 0}
+
+    async def slow_codegen(self, agent, task_id, *args, **kwargs):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return {"success": True}
+
+    monkeypatch.setattr(OrchestrationCoordinator, "_execute_codegen_task", slow_codegen)
+
+    async def run():
+        results = await coordinator._execute_parallel(plan, session)
+        await coordinator.shutdown()
+        return results
+
+    results = asyncio.run(run())
+    assert len(results) == 6
+    assert in_flight["peak"] == 2
+    assert coordinator._workers == []
+
+
+def test_orchestrate_task_runs_through_pipeline():
+    coordinator = _make_coordinator()
+    task = {"id": "root", "description": "x" * 30, "requirements": []}
+
+    async def run():
+        results = await asyncio.gather(*(coordinator.orchestrate_task(dict(task)) for _ in range(3)))
+        await coordinator._q_postprocess.join()
+        stats = coordinator.get_orchestration_stats()
+        await coordinator.shutdown()
+        return results, stats
+
+    results, stats = asyncio.run(run())
+    assert all(r["success"] for r in results)
+    assert len({r["session_id"] for r in results}) == 3
+    assert all(len(r["result"]) == 3 for r in results)
+    logged = "\n".join(coordinator.byterover.knowledge)
+    assert all(r["session_id"] in logged for r in results)
+    assert stats["pipeline_queue_depths"] == {"analyze": 0, "execute": 0, "postprocess": 0}
+
+
+def test_orchestrate_task_reports_stage_failure(monkeypatch):
+    coordinator = _make_coordinator()
+
+    async def broken_analysis(self, task_data):
+        raise RuntimeError("analysis backend down")
+
+    monkeypatch.setattr(OrchestrationCoordinator, "_analyze_task_complexity", broken_analysis)
+
+    async def run():
+        result = await coordinator.orchestrate_task({"id": "root"})
+        await coordinator.shutdown()
+        return result
+
+    result = asyncio.run(run())
+    assert result["success"] is False
+    assert result["error"] == "analysis backend down"
+    assert coordinator.active_sessions[result["session_id"]].status.value == "failed"
+
+
+def test_execute_pipeline_dispatches_ready_tasks_and_threads_context(monkeypatch):
+    coordinator = _make_coordinator()
+    session, plan = _make_session(
+        coordinator, {"gen-a": "codegen-agent", "gen-b": "codegen-agent", "judge-a": "testing-agent"}
+    )
+    # judge-a only needs gen-a, so it must not wait for the slow gen-b
+    plan["dependencies"] = {"judge-a": {"gen-a"}}
+    order = []
+    contexts = {}
+
+    async def fake_with_context(self, agent_id, task_id, execution, context, session):
+        contexts[task_id] = context
+        await asyncio.sleep(0.05 if task_id == "gen-b" else 0.001)
+        order.append(task_id)
+        return {"success": True, "task": task_id}
+
+    monkeypatch.setattr(OrchestrationCoordinator, "_execute_agent_task_with_context", fake_with_context)
+
+    results = asyncio.run(coordinator._execute_pipeline(plan, session))
+    assert set(results) == {"gen-a", "gen-b", "judge-a"}
+    assert order.index("judge-a") < order.index("gen-b")
+    assert contexts["judge-a"] == {"success": True, "task": "gen-a"}
+    assert contexts["gen-a"] is None
+
+
+def test_execute_pipeline_defaults_to_linear_chain(monkeypatch):
+    coordinator = _make_coordinator()
+    session, plan = _make_session(coordinator, {"a": "codegen-agent", "b": "testing-agent", "c": "codegen-agent"})
+    contexts = {}
+
+    async def fake_with_context(self, agent_id, task_id, execution, context, session):
+        contexts[task_id] = context
+        return {"task": task_id}
+
+    monkeypatch.setattr(OrchestrationCoordinator, "_execute_agent_task_with_context", fake_with_context)
+
+    asyncio.run(coordinator._execute_pipeline(plan, session))
+    assert contexts == {"a": None, "b": {"task": "a"}, "c": {"task": "b"}}
+
+
+def test_session_indexes_executions_by_task():
+    session = OrchestrationSession(session_id="s-1", root_task_id="root")
+    execution = AgentExecution(agent_id="codegen-agent", task_id="t1")
+    session.add_execution(execution)
+    assert session.agent_executions == [execution]
+    assert session.executions_by_task["t1"] is execution
+
+
+def test_session_status_buckets_track_transitions():
+    session = OrchestrationSession(session_id="s-1", root_task_id="root")
+    first = AgentExecution(agent_id="codegen-agent", task_id="t1")
+    second = AgentExecution(agent_id="testing-agent", task_id="t2")
+    session.add_execution(first)
+    session.add_execution(second)
+    assert session.count_executions(TaskStatus.PENDING) == 2
+
+    session.set_execution_status(first, TaskStatus.IN_PROGRESS)
+    session.set_execution_status(second, TaskStatus.IN_PROGRESS)
+    session.set_execution_status(second, TaskStatus.FAILED)
+    assert session.get_active_executions() == [first]
+    assert session.get_failed_executions() == [second]
+    assert session.get_completed_executions() == []
+    assert session.count_executions(TaskStatus.PENDING) == 0
+
+
+def test_agent_match_score_uses_capability_sets():
+    coordinator = _make_coordinator()
+    required = coordinator._get_required_skills_for_task("testing")
+    assert required == frozenset({"testing", "pytest", "jest"})
+    testing_agent = coordinator.agent_pool["testing-agent"]
+    codegen_agent = coordinator.agent_pool["codegen-agent"]
+    # type match (0.4) + two capability matches (0.4) + default performance (0.1)
+    assert coordinator._calculate_agent_task_match_score(testing_agent, required) == pytest.approx(0.9)
+    assert coordinator._calculate_agent_task_match_score(codegen_agent, required) == pytest.approx(0.1)
+    assert coordinator._get_required_skills_for_task("unknown") == frozenset({"generic"})
+
+
+def test_select_agents_picks_best_match():
+    coordinator = _make_coordinator()
+    selected = asyncio.run(coordinator._select_agents_for_task({"type": "testing"}))
+    assert [a.name for a in selected] == ["testing-agent"]
+    assert asyncio.run(coordinator._select_agents_for_task({"type": "analysis"})) == []
+
+
+def test_plan_cache_reuses_decomposition_with_fresh_ids(monkeypatch):
+    coordinator = _make_coordinator()
+    calls = {"count": 0}
+    original = OrchestrationCoordinator._analyze_task_complexity
+
+    async def counting_analysis(self, task_data):
+        calls["count"] += 1
+        return await original(self, task_data)
+
+    monkeypatch.setattr(OrchestrationCoordinator, "_analyze_task_complexity", counting_analysis)
+    task = {"id": "root-1", "description": "x" * 30, "requirements": []}
+
+    async def run():
+        first = await coordinator._analyze_and_decompose_task(task)
+        coordinator._store_plan_template(first)
+        second = await coordinator._analyze_and_decompose_task({**task, "id": "root-2"})
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert calls["count"] == 1
+    assert len(second["sub_tasks"]) == len(first["sub_tasks"]) == 3
+    assert {t["id"] for t in first["sub_tasks"]}.isdisjoint(t["id"] for t in second["sub_tasks"])
+    assert all(t["parent_id"] == "root-2" for t in second["sub_tasks"])
+    assert second["original_task"]["id"] == "root-2"
+
+    coordinator.plan_cache_ttl_seconds = -1
+    asyncio.run(coordinator._analyze_and_decompose_task(task))
+    assert calls["count"] == 2
+
+
+def test_durations_use_monotonic_clock_and_cleanup_honours_retention():
+    coordinator = _make_coordinator()
+    task = {"id": "root", "description": "short", "requirements": []}
+
+    async def run():
+        result = await coordinator.orchestrate_task(task)
+        await coordinator.shutdown()
+        return result
+
+    result = asyncio.run(run())
+    session = coordinator.active_sessions[result["session_id"]]
+    assert session.end_monotonic >= session.start_monotonic
+    assert session.total_duration.total_seconds() == pytest.approx(
+        session.end_monotonic - session.start_monotonic, abs=1e-6
+    )
+    for execution in session.agent_executions:
+        assert execution.duration is not None
+
+    asyncio.run(coordinator._cleanup_completed_sessions())
+    assert result["session_id"] in coordinator.active_sessions
+    coordinator.session_retention_seconds = -1
+    asyncio.run(coordinator._cleanup_completed_sessions())
+    assert result["session_id"] not in coordinator.active_sessions
+
+
+def test_agent_task_timeout_marks_execution_failed(monkeypatch):
+    coordinator = _make_coordinator()
+    coordinator.task_timeout_seconds = 0.01
+    session, plan = _make_session(coordinator, {"t1": "codegen-agent"})
+
+    async def hung_codegen(self, agent, task_id, *args, **kwargs):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(OrchestrationCoordinator, "_execute_codegen_task", hung_codegen)
+
+    results = asyncio.run(coordinator._execute_sequential(plan, session))
+    assert results["t1"]["success"] is False
+    assert "timeout" in results["t1"]["error"]
+    assert session.get_failed_executions()[0].task_id == "t1"
+
+
+def test_reaper_fails_stuck_executions():
+    coordinator = _make_coordinator()
+    session, _ = _make_session(coordinator, {"t1": "codegen-agent", "t2": "testing-agent"})
+    coordinator.active_sessions[session.session_id] = session
+    stuck, fresh = session.agent_executions
+    stuck.start_monotonic = time.monotonic() - coordinator.task_timeout_seconds - 1
+    fresh.start_monotonic = time.monotonic()
+    session.set_execution_status(stuck, TaskStatus.IN_PROGRESS)
+    session.set_execution_status(fresh, TaskStatus.IN_PROGRESS)
+
+    assert coordinator._reap_stuck_executions() == 1
+    assert stuck.status == TaskStatus.FAILED
+    assert stuck.error == "timeout (reaped)"
+    assert fresh.status == TaskStatus.IN_PROGRESS
+
+
+def test_worker_pool_serves_higher_queue_levels_first():
+    from src.orchestration.coordinator import QUEUE_BACKGROUND, QUEUE_INTERACTIVE, QUEUE_SUBTASK
+
+    coordinator = _make_coordinator()
+    coordinator.max_concurrent_agents = 1
+    order = []
+
+    async def job(name):
+        order.append(name)
+
+    async def run():
+        blocker = asyncio.Event()
+
+        async def hold():
+            await blocker.wait()
+
+        first = coordinator._submit(hold(), QUEUE_SUBTASK)
+        await asyncio.sleep(0)
+        futures = [
+            coordinator._submit(job("background"), QUEUE_BACKGROUND),
+            coordinator._submit(job("subtask"), QUEUE_SUBTASK),
+            coordinator._submit(job("interactive"), QUEUE_INTERACTIVE),
+        ]
+        blocker.set()
+        await asyncio.gather(first, *futures)
+        await coordinator.shutdown()
+
+    asyncio.run(run())
+    assert order == ["interactive", "subtask", "background"]
+
+
+def test_boost_priorities_lifts_waiting_jobs():
+    from src.orchestration.coordinator import QUEUE_BACKGROUND, QUEUE_INTERACTIVE
+
+    coordinator = _make_coordinator()
+
+    async def run():
+        coordinator.max_concurrent_agents = 0
+        future = coordinator._submit(asyncio.sleep(0), QUEUE_BACKGROUND)
+        assert coordinator._boost_priorities() == 1
+        assert len(coordinator._task_queues[QUEUE_INTERACTIVE]) == 1
+        await coordinator.shutdown()
+        return future
+
+    assert asyncio.run(run()).cancelled()
+
+
+def test_token_bucket_limits_rate_and_applies_aimd():
+    from src.orchestration.coordinator import TokenBucket
+
+    bucket = TokenBucket(rate=100.0, burst=2)
+
+    async def drain():
+        start = time.monotonic()
+        for _ in range(4):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    # two tokens come from the burst, the other two need ~10 ms of refill each
+    assert asyncio.run(drain()) >= 0.015
+    bucket.aimd_backoff()
+    assert bucket.rate == 50.0
+    bucket.record_success()
+    assert bucket.rate == 60.0
+    for _ in range(10):
+        bucket.record_success()
+    assert bucket.rate == 100.0
+
+
+def test_rate_limited_result_backs_off_endpoint(monkeypatch):
+    coordinator = _make_coordinator()
+    session, plan = _make_session(coordinator, {"t1": "codegen-agent"})
+
+    async def rate_limited(self, agent, task_id, *args, **kwargs):
+        return {"success": False, "status_code": 429}
+
+    monkeypatch.setattr(OrchestrationCoordinator, "_execute_codegen_task", rate_limited)
+    asyncio.run(coordinator._execute_sequential(plan, session))
+    bucket = coordinator._buckets["http://localhost:3001"]
+    assert bucket.rate == coordinator.endpoint_rate_limit / 2
+
+
+def test_session_completion_logs_are_batched():
+    coordinator = _make_coordinator()
+    sessions = [OrchestrationSession(session_id=f"s-{i}", root_task_id="root") for i in range(5)]
+
+    async def run():
+        for session in sessions:
+            await coordinator._log_session_completion(session)
+        await asyncio.sleep(coordinator.log_flush_interval * 2)
+        await coordinator.shutdown()
+
+    asyncio.run(run())
+    assert len(coordinator.byterover.knowledge) == 1
+    assert all(s.session_id in coordinator.byterover.knowledge[0] for s in sessions)
+
+
+def test_session_completion_logs_work_with_sync_client(tmp_path):
+    from src.mcp_adapter.client import ByteroverClient
+
+    coordinator = OrchestrationCoordinator(ByteroverClient(endpoint=None, offline_dir=str(tmp_path)))
+
+    async def run():
+        await coordinator._log_session_completion(OrchestrationSession(session_id="s-sync", root_task_id="root"))
+        await coordinator.shutdown()
+
+    asyncio.run(run())
+    records = list(tmp_path.glob("*_byterover-store-knowledge.json"))
+    assert len(records) == 1
+    assert "s-sync" in records[0].read_text(encoding="utf-8")
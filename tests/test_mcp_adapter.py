@@ -15,3 +15,46 @@ def test_offline_save_plan(tmp_path):
     content = json.loads(offline_file.read_text(encoding="utf-8"))
     assert content["action"] == "byterover-save-implementation-plan"
     assert content["payload"]["plan"]["title"] == "Test Plan"
+
+
+def test_offline_filenames_are_ordered(tmp_path):
+    client = ByteroverClient(endpoint=None, offline_dir=str(tmp_path))
+    first = Path(client.byterover_store_knowledge("one")["offline_file"])
+    second = Path(client.byterover_store_knowledge("two")["offline_file"])
+    assert first.name < second.name
+    content = json.loads(second.read_text(encoding="utf-8"))
+    assert content["saved_at"].startswith(second.name[:4])
+
+
+def test_context_manager_closes_session(tmp_path):
+    with ByteroverClient(endpoint=None, offline_dir=str(tmp_path)) as client:
+        assert client.byterover_store_knowledge("x")["success"] is True
+    assert client.session.is_closed
+    client.close()
+
+
+def test_async_context_manager_closes_session(tmp_path):
+    import asyncio
+
+    async def run():
+        async with ByteroverClient(endpoint=None, offline_dir=str(tmp_path)) as client:
+            client.byterover_store_knowledge("x")
+        return client
+
+    assert asyncio.run(run()).session.is_closed
+
+
+def test_sync_offline_fsyncs_directory_once(tmp_path, monkeypatch):
+    import os
+
+    client = ByteroverClient(endpoint=None, offline_dir=str(tmp_path))
+    synced = []
+    monkeypatch.setattr(os, "fsync", lambda fd: synced.append(fd))
+    client.byterover_store_knowledge("one")
+    client.byterover_store_knowledge("two")
+    client.sync_offline()
+    client.sync_offline()
+    if hasattr(os, "O_DIRECTORY"):
+        assert len(synced) == 1
+    client.close()
+    assert client._offline_dir_fd is None
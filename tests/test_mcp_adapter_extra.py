@@ -1,9 +1,9 @@
 import json
-import requests
+import httpx
 from pathlib import Path
 
 import json
-import requests
+import httpx
 from pathlib import Path
 
 from src.mcp_adapter.client import ByteroverClient
@@ -12,19 +12,15 @@ from src.mcp_adapter.client import ByteroverClient
 def test_headers_and_auth_sent():
     client = ByteroverClient(endpoint="https://api.local", extension_id="ext-123", auth_token="tok-xyz", max_retries=1)
 
-    class FakeResponse(requests.Response):
+    class FakeResponse(httpx.Response):
         def __init__(self):
-            super().__init__()
-            self._content = json.dumps({"ok": True}).encode('utf-8')
-            self.status_code = 200
+            super().__init__(200, content=json.dumps({"ok": True}).encode('utf-8'))
 
         def raise_for_status(self):
             return None
 
         def json(self):
-            if self._content is None:
-                raise ValueError("Response content is None")
-            return json.loads(self._content.decode('utf-8'))
+            return json.loads(self.content.decode('utf-8'))
 
     def fake_post(*args, **kwargs):
         headers = kwargs.get("headers")
@@ -43,7 +39,7 @@ def test_retry_exhaustion_writes_offline(tmp_path):
     client = ByteroverClient(endpoint="https://does.not.exist", offline_dir=str(tmp_path), max_retries=2, backoff_factor=0)
 
     def always_fail(*a, **k):
-        raise requests.exceptions.ConnectionError("simulated")
+        raise httpx.ConnectError("simulated")
 
     client.session.post = always_fail
 
@@ -65,7 +61,7 @@ def test_retry_attempts_count(tmp_path):
 
     def failing_post(*a, **kw):
         counter["calls"] += 1
-        raise requests.exceptions.ConnectionError("sim")
+        raise httpx.ConnectError("sim")
 
     client.session.post = failing_post
     res = client.byterover_store_knowledge("x")
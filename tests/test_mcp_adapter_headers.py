@@ -24,7 +24,7 @@ def test_headers_and_auth(monkeypatch, tmp_path):
         return DummyResp({'ok': True})
 
 
-    monkeypatch.setattr('requests.Session.post', fake_post, raising=False)
+    monkeypatch.setattr('httpx.Client.post', fake_post, raising=False)
 
     from src.mcp_adapter.client import ByteroverClient
 
@@ -44,12 +44,12 @@ def test_headers_and_auth(monkeypatch, tmp_path):
 
 
 def test_retry_and_offline_on_failed_requests(monkeypatch, tmp_path):
-    import requests
+    import httpx
 
     def failing_post(self, url, json=None, headers=None, timeout=None):
-        raise requests.exceptions.RequestException("network")
+        raise httpx.ConnectError("network")
 
-    monkeypatch.setattr('requests.Session.post', failing_post, raising=False)
+    monkeypatch.setattr('httpx.Client.post', failing_post, raising=False)
 
     from src.mcp_adapter.client import ByteroverClient
 
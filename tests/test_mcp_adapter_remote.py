@@ -2,11 +2,11 @@ import json
 from unittest.mock import patch, MagicMock
 
 import pytest
-import requests
+import httpx
 from src.mcp_adapter.client import ByteroverClient
 
 
-@patch("src.mcp_adapter.client.requests.sessions.Session.post")
+@patch("src.mcp_adapter.client.httpx.Client.post")
 def test_remote_create_project(mock_post):
     mock_post.return_value.status_code = 200
     mock_post.return_value.json.return_value = {"success": True, "project_id": "proj-1"}
@@ -23,7 +23,7 @@ def test_remote_create_project(mock_post):
     assert headers.get("Authorization") == "Bearer tok-123"
 
 
-@patch("src.mcp_adapter.client.requests.sessions.Session.post")
+@patch("src.mcp_adapter.client.httpx.Client.post")
 def test_remote_create_task(mock_post):
     mock_post.return_value.status_code = 200
     mock_post.return_value.json.return_value = {"success": True, "task_id": "task-1"}
@@ -39,7 +39,7 @@ def test_remote_create_task(mock_post):
     assert headers.get("Authorization") == "Bearer tok-123"
 
 
-@patch("src.mcp_adapter.client.requests.sessions.Session.post")
+@patch("src.mcp_adapter.client.httpx.Client.post")
 def test_remote_retrieve_active_plans(mock_post):
     mock_post.return_value.status_code = 200
     mock_post.return_value.json.return_value = {"success": True, "plans": []}
@@ -54,15 +54,15 @@ def test_remote_retrieve_active_plans(mock_post):
     assert headers.get("Authorization") == "Bearer tok-123"
 
 
-@patch("src.mcp_adapter.client.requests.sessions.Session.post")
+@patch("src.mcp_adapter.client.httpx.Client.post")
 def test_remote_retry_backoff(mock_post):
     # first call raises, second returns success
-    def side_effect(url, json, timeout, headers=None):
+    def side_effect(url, json, headers=None):
         if not hasattr(side_effect, "count"):
             side_effect.count = 0
         side_effect.count += 1
         if side_effect.count == 1:
-            raise requests.exceptions.RequestException("network")
+            raise httpx.ConnectError("network")
         mock_resp = MagicMock()
         mock_resp.status_code = 200
         mock_resp.json.return_value = {"success": True, "project_id": "proj-retry"}
@@ -73,3 +73,11 @@ def test_remote_retry_backoff(mock_post):
     res = client.byterover_create_project("Retry Project")
     assert res["success"] is True
     assert res["project_id"] == "proj-retry"
+
+
+def test_backoff_schedule_is_jittered_exponential():
+    client = ByteroverClient(endpoint="http://localhost:8051", max_retries=4, backoff_factor=0.5)
+    assert len(client._backoff_schedule) == 3
+    for attempt, delay in enumerate(client._backoff_schedule):
+        base = 0.5 * (2**attempt)
+        assert base <= delay <= base + 0.5